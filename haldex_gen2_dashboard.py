@@ -4,32 +4,218 @@ Haldex DEM Fixed Dashboard
 Simple, reliable in-place terminal updates using proper cursor positioning
 """
 
+import os
 import sys
 import time
+import bisect
+import select
+import logging
+import selectors
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from typing import NamedTuple, Optional
 from haldex_gen2_monitor import HaldexMonitor
 
+try:
+    import termios
+    import tty
+except ImportError:
+    # No cbreak terminal support (e.g. Windows) - keyboard controls are disabled
+    termios = None
+
+class SensorSnapshot(NamedTuple):
+    """Immutable sensor values and collector status, published as one object"""
+    oil_temperature_c: Optional[float] = None
+    oil_temperature_f: Optional[float] = None
+    oil_pressure_bar: Optional[float] = None
+    oil_pressure_psi: Optional[float] = None
+    pump_current: Optional[int] = None
+    solenoid_current: Optional[int] = None
+    fl: Optional[float] = None  # Wheel speeds (km/h)
+    fr: Optional[float] = None
+    rl: Optional[float] = None
+    rr: Optional[float] = None
+    speed_diff: Optional[float] = None  # Spread between fastest and slowest wheel
+    valid: int = 0  # MASK_* bits for sections with complete data
+    version: int = 0  # Bumped whenever sensor values change
+    last_update: Optional[datetime] = None
+    update_count: int = 0
+    errors: int = 0
+
+# Sensors polled by the collector
+SENSOR_NAMES = ('oil_temperature', 'oil_pressure', 'pump_current', 'wheel_speeds')
+
+# Adaptive polling - every sensor starts at the collector interval; slow-moving
+# sensors back off towards their maximum period while their value is stable
+COLLECT_INTERVAL = 1.0
+MAX_SENSOR_PERIODS = {
+    'oil_temperature': 5.0,
+    'oil_pressure': 3.0,
+    'pump_current': COLLECT_INTERVAL,
+    'wheel_speeds': COLLECT_INTERVAL
+}
+# Result key and the change that counts as movement, per adaptive sensor
+CHANGE_THRESHOLDS = {
+    'oil_temperature': ('oil_temperature_celsius', 1.0),
+    'oil_pressure': ('oil_pressure_bar', 0.05)
+}
+STABLE_POLLS = 3  # Stable readings in a row before the period is doubled
+
+# Snapshot validity bits - set once every field of a section holds a value
+MASK_TEMP = 1
+MASK_PRESSURE = 2
+MASK_PUMP = 4
+MASK_WHEELS = 8
+
+# Every possible 20-cell bar, indexed by number of filled cells
+BARS = tuple("█" * fill + "░" * (20 - fill) for fill in range(21))
+
+# Status labels, looked up with bisect against ascending thresholds
+TEMP_THRESHOLDS = (0, 20, 50, 80)
+TEMP_LABELS = ("🥶 Very Cold", "❄️  Cold", "✅ Normal", "🔥 Warm", "🚨 Hot")
+PRESSURE_THRESHOLDS = (0.5, 1.0, 5.0)
+PRESSURE_LABELS = ("🚨 Very Low", "⚠️  Low", "✅ Normal", "🔥 High")
+# Wheel speed spread (km/h) - bisect_left, as the limits themselves are in range
+SPEED_DIFF_THRESHOLDS = (2.0, 5.0)
+SPEED_DIFF_LABELS = ("✅ Balanced", "⚖️  Minor difference", "⚠️  High difference")
+
+# Section templates - each section is formatted with a single call per frame
+STATUS_TEMPLATE = "Status: Last Update: {time} | Updates: {update_count} | Errors: {errors}"
+STATUS_WAITING = "Status: Waiting for data..."
+STATUS_PAUSED = " | PAUSED"
+
+TEMPERATURE_TEMPLATE = (
+    "🌡️  OIL TEMPERATURE\n"
+    "   {temp_c:.1f}°C ({temp_f:.1f}°F)\n"
+    "   Status: {status}\n"
+    "   [{bar}] (-10°C to 120°C)"
+)
+TEMPERATURE_NO_DATA = (
+    "🌡️  OIL TEMPERATURE\n"
+    "   No Data\n"
+    "   Status: Unknown\n"
+    f"   [{BARS[0]}] (-10°C to 120°C)"
+)
+
+PRESSURE_TEMPLATE = (
+    "💧 OIL PRESSURE\n"
+    "   {pressure:.2f} bar ({psi:.1f} psi)\n"
+    "   Status: {status}\n"
+    "   [{bar}] (0-10 bar)"
+)
+PRESSURE_NO_DATA = (
+    "💧 OIL PRESSURE\n"
+    "   No Data\n"
+    "   Status: Unknown\n"
+    f"   [{BARS[0]}] (0-10 bar)"
+)
+
+CURRENTS_TEMPLATE = (
+    "⚡ ELECTRICAL CURRENTS\n"
+    "   Pump:     {pump:>6} ADC ({pump_status})\n"
+    "   Solenoid: {solenoid:>6} ADC ({solenoid_status})"
+)
+CURRENTS_NO_DATA = (
+    "⚡ ELECTRICAL CURRENTS\n"
+    "   Pump:     No Data\n"
+    "   Solenoid: No Data"
+)
+
+WHEEL_SPEEDS_TEMPLATE = (
+    "🚗 WHEEL SPEEDS\n"
+    "   FL: {fl:>5.1f} km/h  FR: {fr:>5.1f} km/h\n"
+    "   RL: {rl:>5.1f} km/h  RR: {rr:>5.1f} km/h\n"
+    "   Status: {status} (Δ{speed_diff:.1f})"
+)
+WHEEL_SPEEDS_NO_DATA = (
+    "🚗 WHEEL SPEEDS\n"
+    "   FL: ----- km/h  FR: ----- km/h\n"
+    "   RL: ----- km/h  RR: ----- km/h\n"
+    "   Status: No Data"
+)
+
+# Terminal control sequences, pre-encoded for direct writes to the byte stream
+CLEAR_SCREEN = b'\033[2J\033[H'
+HIDE_CURSOR = b'\033[?25l'
+SHOW_CURSOR = b'\033[?25h'
+
+# Screen layout - first row of each fixed-height section
+SECTION_ROWS = (
+    ('title', 1),
+    ('status', 3),
+    ('temperature', 5),
+    ('pressure', 10),
+    ('currents', 15),
+    ('wheel_speeds', 19),
+    ('footer', 24)
+)
+# Cursor positioning prefix for each section
+SECTION_POSITIONS = tuple((name, f"\033[{row};1H".encode('utf-8')) for name, row in SECTION_ROWS)
+
+def encode_section(text):
+    """Encode section text for drawing, clearing the rest of every line"""
+    return (text.replace("\n", "\033[K\n") + "\033[K").encode('utf-8')
+
+def advance_tick(next_tick, interval):
+    """Advance a fixed-rate schedule, returning the next tick and the delay until it"""
+    next_tick += interval
+    now = time.monotonic()
+    if now - next_tick > interval:
+        # More than one interval behind - resync instead of bursting to catch up
+        next_tick = now + interval
+    return next_tick, max(0.0, next_tick - now)
+
 class FixedDashboard:
     def __init__(self, interface='gs_usb', channel='/dev/tty.usbmodem*', bitrate=500000):
         self.monitor = HaldexMonitor(interface, channel, bitrate)
-        self.running = False
-        self.data_lock = threading.Lock()
-
-        # Data storage
-        self.sensor_data = {
-            'oil_temperature_c': None,
-            'oil_temperature_f': None,
-            'oil_pressure_bar': None,
-            'pump_current': None,
-            'solenoid_current': None,
-            'wheel_speeds': {'fl': None, 'fr': None, 'rl': None, 'rr': None}
+        self._stop = threading.Event()
+
+        # Sensor requests are fanned out over a fixed pool; the monitor routes
+        # each response to its request, so they are in flight together
+        self._pool = ThreadPoolExecutor(max_workers=len(SENSOR_NAMES), thread_name_prefix='sensor')
+        self._request = self.monitor.request_sensor
+
+        # Adaptive polling state
+        self._sensor_periods = dict.fromkeys(SENSOR_NAMES, COLLECT_INTERVAL)
+        self._next_due = dict.fromkeys(SENSOR_NAMES, 0.0)
+        self._stable_polls = dict.fromkeys(SENSOR_NAMES, 0)
+        self._last_values = {}
+
+        # Data storage - the collector publishes a new snapshot each cycle by
+        # swapping this reference, so the renderer reads one consistent
+        # object without a lock or a copy
+        self._snapshot = SensorSnapshot()
+
+        # Static screen chrome, built once
+        self._SEPARATOR = "=" * 60
+        self._TITLE_BLOCK = "🔧 HALDEX DEM MODULE - LIVE MONITOR 🔧\n" + self._SEPARATOR
+        # Footer for when keys are read; without a cbreak terminal only Ctrl+C works
+        self._KEYBOARD_FOOTER_BLOCK = self._SEPARATOR + "\nq: quit | p: pause | r: reset counters | Updating every 1 second"
+        self._PLAIN_FOOTER_BLOCK = self._SEPARATOR + "\nPress Ctrl+C to quit | Updating every 1 second"
+        self._FOOTER_BLOCK = self._PLAIN_FOOTER_BLOCK
+
+        # Frames bypass sys.stdout's buffering and go out in one write(2)
+        self._stdout_fd = sys.stdout.fileno()
+
+        # Constant section text, encoded once
+        self._ENCODED_SECTIONS = {
+            text: encode_section(text)
+            for text in (self._TITLE_BLOCK, self._KEYBOARD_FOOTER_BLOCK,
+                         self._PLAIN_FOOTER_BLOCK, STATUS_WAITING,
+                         TEMPERATURE_NO_DATA, PRESSURE_NO_DATA,
+                         CURRENTS_NO_DATA, WHEEL_SPEEDS_NO_DATA)
         }
 
-        # Status
-        self.last_update = None
-        self.update_count = 0
-        self.errors = 0
+        # Section text last written to the screen, used for differential redraw,
+        # and the snapshot version those sections were formatted from
+        self._last_rendered = {}
+        self._rendered_version = None
+
+        # Keyboard control state (only touched by the render loop)
+        self._paused = None  # Snapshot frozen on screen while paused
+        self._counter_base = (0, 0)  # update_count/errors at the last reset
+        self._time_text = (None, None)  # (last_update, formatted HH:MM:SS)
 
     def celsius_to_fahrenheit(self, celsius):
         """Convert Celsius to Fahrenheit"""
@@ -37,233 +223,363 @@ class FixedDashboard:
             return (celsius * 9.0 / 5.0) + 32
         return None
 
+    def write_terminal(self, payload):
+        """Write pre-encoded text and escape sequences straight to stdout's descriptor"""
+        view = memoryview(payload)
+        while view:
+            try:
+                written = os.write(self._stdout_fd, view)
+            except BlockingIOError:
+                # Non-blocking stdout with a full pipe - wait until it drains
+                select.select([], [self._stdout_fd], [])
+                continue
+            view = view[written:]
+
     def clear_screen(self):
         """Clear screen and move cursor to top"""
-        sys.stdout.write('\033[2J\033[H')
-        sys.stdout.flush()
+        self.write_terminal(CLEAR_SCREEN)
 
     def hide_cursor(self):
         """Hide terminal cursor"""
-        sys.stdout.write('\033[?25l')
-        sys.stdout.flush()
+        self.write_terminal(HIDE_CURSOR)
 
     def show_cursor(self):
         """Show terminal cursor"""
-        sys.stdout.write('\033[?25h')
-        sys.stdout.flush()
+        self.write_terminal(SHOW_CURSOR)
+
+    def request_sensor(self, sensor_name):
+        """Request a single sensor"""
+        return self._request(sensor_name, timeout=1.0)
+
+    def apply_sensor_result(self, updates, sensor_name, result):
+        """Collect the snapshot fields carried by a sensor response"""
+        get = result.get
+        if sensor_name == 'oil_temperature':
+            temp_c = get('oil_temperature_celsius')
+            updates['oil_temperature_c'] = temp_c
+            updates['oil_temperature_f'] = self.celsius_to_fahrenheit(temp_c)
+            mask = MASK_TEMP
+            valid = temp_c is not None
+        elif sensor_name == 'oil_pressure':
+            pressure = get('oil_pressure_bar')
+            valid = pressure is not None
+            updates['oil_pressure_bar'] = pressure
+            updates['oil_pressure_psi'] = pressure * 14.504 if valid else None
+            mask = MASK_PRESSURE
+        elif sensor_name == 'pump_current':
+            pump = get('pump_current_raw')
+            solenoid = get('solenoid_current_raw')
+            updates['pump_current'] = pump
+            updates['solenoid_current'] = solenoid
+            mask = MASK_PUMP
+            valid = pump is not None and solenoid is not None
+        elif sensor_name == 'wheel_speeds':
+            fl = updates['fl'] = get('front_left_speed_kmh')
+            fr = updates['fr'] = get('front_right_speed_kmh')
+            rl = updates['rl'] = get('rear_left_speed_kmh')
+            rr = updates['rr'] = get('rear_right_speed_kmh')
+            mask = MASK_WHEELS
+            valid = None not in (fl, fr, rl, rr)
+            if valid:
+                # Straight-line min/max over the four wheels
+                min_speed = fl if fl < fr else fr
+                pair = rl if rl < rr else rr
+                min_speed = min_speed if min_speed < pair else pair
+                max_speed = fl if fl > fr else fr
+                pair = rl if rl > rr else rr
+                max_speed = max_speed if max_speed > pair else pair
+                updates['speed_diff'] = max_speed - min_speed
+            else:
+                updates['speed_diff'] = None
+        else:
+            return
+
+        updates['valid'] = updates['valid'] | mask if valid else updates['valid'] & ~mask
+
+    def schedule_next_poll(self, sensor_name, result, tick):
+        """Adapt a sensor's poll period to how fast its value is moving"""
+        period = self._sensor_periods[sensor_name]
+        change = CHANGE_THRESHOLDS.get(sensor_name)
+
+        if change:
+            key, threshold = change
+            value = result.get(key)
+            previous = self._last_values.get(sensor_name)
+            self._last_values[sensor_name] = value
+
+            if value is None or previous is None or abs(value - previous) > threshold:
+                # Moving - poll faster
+                period = max(COLLECT_INTERVAL, period / 2)
+                self._stable_polls[sensor_name] = 0
+            else:
+                self._stable_polls[sensor_name] += 1
+                if self._stable_polls[sensor_name] >= STABLE_POLLS:
+                    # Stable - back off towards the maximum period
+                    period = min(MAX_SENSOR_PERIODS[sensor_name], period * 2)
+                    self._stable_polls[sensor_name] = 0
+
+        self._sensor_periods[sensor_name] = period
+        self._next_due[sensor_name] = tick + period
 
     def collect_sensor_data(self):
         """Background thread to collect sensor data"""
-        while self.running:
+        # Bound once - this loop runs for the life of the dashboard
+        monotonic = time.monotonic
+        now_datetime = datetime.now
+        submit = self._pool.submit
+        request = self.request_sensor
+        apply_result = self.apply_sensor_result
+        schedule_next_poll = self.schedule_next_poll
+        next_due = self._next_due
+        stop = self._stop
+
+        next_tick = monotonic()
+        while not stop.is_set():
+            # Unexpected errors are handled outside the collection loop, which
+            # is re-entered after a back-off; sensor failures are handled inline
             try:
-                updated = False
-
-                # Oil Temperature (most reliable sensor for keep-alive)
-                result = self.monitor.request_sensor('oil_temperature', timeout=1.0)
-                if result:
-                    with self.data_lock:
-                        temp_c = result.get('oil_temperature_celsius')
-                        self.sensor_data['oil_temperature_c'] = temp_c
-                        self.sensor_data['oil_temperature_f'] = self.celsius_to_fahrenheit(temp_c)
-                        updated = True
-
-                # Oil Pressure
-                result = self.monitor.request_sensor('oil_pressure', timeout=1.0)
-                if result:
-                    with self.data_lock:
-                        self.sensor_data['oil_pressure_bar'] = result.get('oil_pressure_bar')
-                        updated = True
-
-                # Pump and Solenoid Current
-                result = self.monitor.request_sensor('pump_current', timeout=1.0)
-                if result:
-                    with self.data_lock:
-                        self.sensor_data['pump_current'] = result.get('pump_current_raw')
-                        self.sensor_data['solenoid_current'] = result.get('solenoid_current_raw')
-                        updated = True
-
-                # Wheel Speeds
-                result = self.monitor.request_sensor('wheel_speeds', timeout=1.0)
-                if result:
-                    with self.data_lock:
-                        speeds = self.sensor_data['wheel_speeds']
-                        speeds['fl'] = result.get('front_left_speed_kmh')
-                        speeds['fr'] = result.get('front_right_speed_kmh')
-                        speeds['rl'] = result.get('rear_left_speed_kmh')
-                        speeds['rr'] = result.get('rear_right_speed_kmh')
-                        updated = True
-
-                with self.data_lock:
+                while not stop.is_set():
+                    updated = False
+                    failures = 0
+                    snapshot = self._snapshot
+                    updates = {'valid': snapshot.valid}
+
+                    # Request every sensor that is due and take results as they
+                    # arrive; failed sensors stay due and are retried next cycle.
+                    # Due times are measured from the scheduled tick, not the
+                    # wake-up, so wake-up jitter cannot skip a whole tick.
+                    tick = next_tick
+                    futures = {
+                        submit(request, name): name
+                        for name in SENSOR_NAMES
+                        if tick >= next_due[name]
+                    }
+                    for future in as_completed(futures):
+                        sensor_name = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = None
+                        if result:
+                            apply_result(updates, sensor_name, result)
+                            schedule_next_poll(sensor_name, result, tick)
+                            updated = True
+                        else:
+                            failures += 1
+
                     if updated:
-                        self.last_update = datetime.now()
-                        self.update_count += 1
-                    else:
-                        self.errors += 1
+                        updates['version'] = snapshot.version + 1
+                        updates['last_update'] = now_datetime()
+                        updates['update_count'] = snapshot.update_count + 1
+                    if failures:
+                        updates['errors'] = snapshot.errors + failures
 
-                time.sleep(1.0)  # Collect data every second
+                    # Publish - a single reference store, atomic under the GIL
+                    if updated or failures:
+                        self._snapshot = snapshot._replace(**updates)
 
-            except Exception as e:
-                with self.data_lock:
-                    self.errors += 1
-                time.sleep(2.0)
+                    # Collect data every second
+                    next_tick, delay = advance_tick(next_tick, COLLECT_INTERVAL)
+                    if stop.wait(delay):
+                        break
 
-    def render_dashboard(self):
-        """Render the dashboard with proper screen control"""
+            except Exception as e:
+                snapshot = self._snapshot
+                self._snapshot = snapshot._replace(errors=snapshot.errors + 1)
+                if stop.wait(2.0):
+                    break
+                next_tick = monotonic()
+
+    def format_status(self, last_update, update_count, errors, paused=False):
+        """Format the status row"""
+        if not last_update:
+            status = STATUS_WAITING
+        else:
+            # The same timestamp is shown on every frame until the next update
+            cached_update, time_text = self._time_text
+            if last_update is not cached_update:
+                time_text = f"{last_update.hour:02d}:{last_update.minute:02d}:{last_update.second:02d}"
+                self._time_text = (last_update, time_text)
+
+            status = STATUS_TEMPLATE.format(
+                time=time_text,
+                update_count=update_count,
+                errors=errors
+            )
+        return status + STATUS_PAUSED if paused else status
+
+    def format_temperature(self, current_data):
+        """Format the oil temperature section"""
+        if not current_data.valid & MASK_TEMP:
+            return TEMPERATURE_NO_DATA
+        temp_c = current_data.oil_temperature_c
+        temp_f = current_data.oil_temperature_f
+
+        # Temperature status with bar (-10°C to 120°C scale)
+        return TEMPERATURE_TEMPLATE.format(
+            temp_c=temp_c,
+            temp_f=temp_f,
+            status=TEMP_LABELS[bisect.bisect_right(TEMP_THRESHOLDS, temp_c)],
+            bar=BARS[max(1, min(20, int(20 * (temp_c + 10) / 130)))]
+        )
+
+    def format_pressure(self, current_data):
+        """Format the oil pressure section"""
+        if not current_data.valid & MASK_PRESSURE:
+            return PRESSURE_NO_DATA
+        pressure = current_data.oil_pressure_bar
+
+        return PRESSURE_TEMPLATE.format(
+            pressure=pressure,
+            psi=current_data.oil_pressure_psi,
+            status=PRESSURE_LABELS[bisect.bisect_right(PRESSURE_THRESHOLDS, pressure)],
+            bar=BARS[max(1, min(20, int(20 * pressure / 10)))]
+        )
+
+    def format_currents(self, current_data):
+        """Format the electrical currents section"""
+        if not current_data.valid & MASK_PUMP:
+            return CURRENTS_NO_DATA
+        pump = current_data.pump_current
+        solenoid = current_data.solenoid_current
+
+        return CURRENTS_TEMPLATE.format(
+            pump=pump,
+            pump_status="🔋 Active" if pump > 100 else "💤 Inactive",
+            solenoid=solenoid,
+            solenoid_status="🔋 Active" if solenoid > 100 else "💤 Inactive"
+        )
+
+    def format_wheel_speeds(self, current_data):
+        """Format the wheel speeds section"""
+        if not current_data.valid & MASK_WHEELS:
+            return WHEEL_SPEEDS_NO_DATA
+        speed_diff = current_data.speed_diff
+
+        return WHEEL_SPEEDS_TEMPLATE.format(
+            fl=current_data.fl,
+            fr=current_data.fr,
+            rl=current_data.rl,
+            rr=current_data.rr,
+            status=SPEED_DIFF_LABELS[bisect.bisect_left(SPEED_DIFF_THRESHOLDS, speed_diff)],
+            speed_diff=speed_diff
+        )
+
+    def draw_frame(self):
+        """Format the current snapshot and repaint the sections that changed"""
+        current_data = self._paused or self._snapshot
+        base_count, base_errors = self._counter_base
+
+        # The status row can change without new data; the sensor sections
+        # are only formatted when a newer snapshot has been published
+        sections = {
+            'status': self.format_status(current_data.last_update,
+                                         current_data.update_count - base_count,
+                                         current_data.errors - base_errors,
+                                         self._paused is not None)
+        }
+        if current_data.version != self._rendered_version:
+            sections.update(
+                title=self._TITLE_BLOCK,
+                temperature=self.format_temperature(current_data),
+                pressure=self.format_pressure(current_data),
+                currents=self.format_currents(current_data),
+                wheel_speeds=self.format_wheel_speeds(current_data),
+                footer=self._FOOTER_BLOCK
+            )
+            self._rendered_version = current_data.version
+
+        # Only repaint sections whose text changed since the last frame,
+        # positioning the cursor at the section's row and clearing each line
+        output = []
+        for name, position in SECTION_POSITIONS:
+            text = sections.get(name)
+            if text is not None and text != self._last_rendered.get(name):
+                encoded = self._ENCODED_SECTIONS.get(text)
+                output.append(position + (encoded or encode_section(text)))
+                self._last_rendered[name] = text
+
+        if output:
+            self.write_terminal(b"".join(output))
+
+    def handle_key(self, key):
+        """Handle a single keystroke"""
+        if key == 'q':
+            self._stop.set()
+        elif key == 'p':
+            # Freeze the values on screen, or resume live updates
+            self._paused = None if self._paused else self._snapshot
+        elif key == 'r':
+            # Reset the displayed counters and repaint the whole screen
+            snapshot = self._snapshot
+            self._counter_base = (snapshot.update_count, snapshot.errors)
+            if self._paused:
+                self._paused = snapshot
+            self._last_rendered.clear()
+            self._rendered_version = None
+            self.write_terminal(CLEAR_SCREEN)
+
+    def wait_for_tick(self, selector, next_tick):
+        """Wait until next_tick, handling keystrokes as soon as they arrive"""
+        if not selector.get_map():
+            self._stop.wait(max(0.0, next_tick - time.monotonic()))
+            return
+
+        while not self._stop.is_set():
+            timeout = next_tick - time.monotonic()
+            if timeout <= 0:
+                return
+            for key, _ in selector.select(timeout):
+                # Function and arrow keys arrive as escape sequences (F2 is
+                # ESC O Q); drop everything from the escape on
+                data = os.read(key.fd, 32).split(b'\x1b', 1)[0]
+                for char in data.decode('utf-8', 'ignore'):
+                    self.handle_key(char)
+                if not self._stop.is_set():
+                    self.draw_frame()
+
+    def render_dashboard(self, keyboard=False):
+        """Render the dashboard with proper screen control
+
+        Args:
+            keyboard: React to keystrokes on stdin (requires a cbreak terminal)
+        """
         update_interval = 1.0  # Update display every second
 
-        while self.running:
-            try:
-                # Move cursor to home position (top-left)
-                sys.stdout.write('\033[H')
-
-                with self.data_lock:
-                    current_data = self.sensor_data.copy()
-                    last_update = self.last_update
-                    update_count = self.update_count
-                    errors = self.errors
-
-                # Build the entire screen content as a single string
-                output = []
-
-                # Title
-                output.append("🔧 HALDEX DEM MODULE - LIVE MONITOR 🔧")
-                output.append("=" * 60)
-
-                # Status
-                if last_update:
-                    status = f"Last Update: {last_update.strftime('%H:%M:%S')} | Updates: {update_count} | Errors: {errors}"
-                else:
-                    status = "Waiting for data..."
-                output.append(f"Status: {status}")
-                output.append("")
-
-                # Oil Temperature
-                output.append("🌡️  OIL TEMPERATURE")
-                temp_c = current_data['oil_temperature_c']
-                temp_f = current_data['oil_temperature_f']
-
-                if temp_c is not None and temp_f is not None:
-                    output.append(f"   {temp_c:.1f}°C ({temp_f:.1f}°F)")
-
-                    # Temperature status with bar
-                    if temp_c < 0:
-                        temp_status = "🥶 Very Cold"
-                        bar_fill = max(1, int(20 * (temp_c + 10) / 130))
-                    elif temp_c < 20:
-                        temp_status = "❄️  Cold"
-                        bar_fill = max(1, int(20 * temp_c / 130))
-                    elif temp_c < 50:
-                        temp_status = "✅ Normal"
-                        bar_fill = max(1, int(20 * temp_c / 130))
-                    elif temp_c < 80:
-                        temp_status = "🔥 Warm"
-                        bar_fill = max(1, int(20 * temp_c / 130))
-                    else:
-                        temp_status = "🚨 Hot"
-                        bar_fill = 20
-
-                    temp_bar = "█" * bar_fill + "░" * (20 - bar_fill)
-                    output.append(f"   Status: {temp_status}")
-                    output.append(f"   [{temp_bar}] (-10°C to 120°C)")
-                else:
-                    output.append("   No Data")
-                    output.append("   Status: Unknown")
-                    output.append("   [░░░░░░░░░░░░░░░░░░░░] (-10°C to 120°C)")
-
-                output.append("")
-
-                # Oil Pressure
-                output.append("💧 OIL PRESSURE")
-                pressure = current_data['oil_pressure_bar']
-                if pressure is not None:
-                    psi = pressure * 14.504
-                    output.append(f"   {pressure:.2f} bar ({psi:.1f} psi)")
-
-                    # Pressure status with bar
-                    if pressure < 0.5:
-                        pressure_status = "🚨 Very Low"
-                    elif pressure < 1.0:
-                        pressure_status = "⚠️  Low"
-                    elif pressure < 5.0:
-                        pressure_status = "✅ Normal"
-                    else:
-                        pressure_status = "🔥 High"
-
-                    bar_fill = max(1, min(20, int(20 * pressure / 10)))
-                    pressure_bar = "█" * bar_fill + "░" * (20 - bar_fill)
-
-                    output.append(f"   Status: {pressure_status}")
-                    output.append(f"   [{pressure_bar}] (0-10 bar)")
-                else:
-                    output.append("   No Data")
-                    output.append("   Status: Unknown")
-                    output.append("   [░░░░░░░░░░░░░░░░░░░░] (0-10 bar)")
-
-                output.append("")
-
-                # Currents
-                output.append("⚡ ELECTRICAL CURRENTS")
-                pump = current_data['pump_current']
-                solenoid = current_data['solenoid_current']
-
-                if pump is not None and solenoid is not None:
-                    pump_status = "🔋 Active" if pump > 100 else "💤 Inactive"
-                    solenoid_status = "🔋 Active" if solenoid > 100 else "💤 Inactive"
-
-                    output.append(f"   Pump:     {pump:>6} ADC ({pump_status})")
-                    output.append(f"   Solenoid: {solenoid:>6} ADC ({solenoid_status})")
-                else:
-                    output.append("   Pump:     No Data")
-                    output.append("   Solenoid: No Data")
-
-                output.append("")
-
-                # Wheel Speeds
-                output.append("🚗 WHEEL SPEEDS")
-                speeds = current_data['wheel_speeds']
-                if all(v is not None for v in speeds.values()):
-                    output.append(f"   FL: {speeds['fl']:>5.1f} km/h  FR: {speeds['fr']:>5.1f} km/h")
-                    output.append(f"   RL: {speeds['rl']:>5.1f} km/h  RR: {speeds['rr']:>5.1f} km/h")
-
-                    # Speed difference analysis
-                    max_speed = max(speeds.values())
-                    min_speed = min(speeds.values())
-                    speed_diff = max_speed - min_speed
-
-                    if speed_diff > 5:
-                        diff_status = "⚠️  High difference"
-                    elif speed_diff > 2:
-                        diff_status = "⚖️  Minor difference"
-                    else:
-                        diff_status = "✅ Balanced"
-
-                    output.append(f"   Status: {diff_status} (Δ{speed_diff:.1f})")
-                else:
-                    output.append("   FL: ----- km/h  FR: ----- km/h")
-                    output.append("   RL: ----- km/h  RR: ----- km/h")
-                    output.append("   Status: No Data")
-
-                output.append("")
-
-                # Footer
-                output.append("=" * 60)
-                output.append("Press Ctrl+C to quit | Updating every 1 second")
-
-                # Add extra blank lines to clear any leftover content
-                output.extend([""] * 5)
-
-                # Write entire screen content at once
-                screen_content = "\n".join(output)
-                sys.stdout.write(screen_content)
-                sys.stdout.flush()
-
-                time.sleep(update_interval)
-
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                # Handle any rendering errors gracefully
-                time.sleep(1)
+        # Only advertise the keys that will actually be read
+        self._FOOTER_BLOCK = self._KEYBOARD_FOOTER_BLOCK if keyboard else self._PLAIN_FOOTER_BLOCK
+
+        # One event loop waits on both the next frame and keyboard input
+        selector = selectors.DefaultSelector()
+        if keyboard:
+            selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+
+        # Bound once - this loop runs for the life of the dashboard
+        draw_frame = self.draw_frame
+        wait_for_tick = self.wait_for_tick
+        stop = self._stop
+
+        next_tick = time.monotonic()
+        try:
+            while not stop.is_set():
+                # Rendering errors are handled outside the frame loop, which
+                # is re-entered after a short pause
+                try:
+                    while not stop.is_set():
+                        draw_frame()
+                        next_tick, _ = advance_tick(next_tick, update_interval)
+                        wait_for_tick(selector, next_tick)
+
+                except Exception as e:
+                    # Handle any rendering errors gracefully
+                    if stop.wait(1.0):
+                        break
+                    next_tick = time.monotonic()
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            selector.close()
 
     def run(self):
         """Run the fixed dashboard"""
@@ -277,28 +593,57 @@ class FixedDashboard:
         print("Connected! Starting dashboard in 2 seconds...")
         time.sleep(2)
 
-        # Clear screen once and hide cursor
-        self.clear_screen()
-        self.hide_cursor()
+        # Monitor log lines would scroll the screen under the fixed-row layout
+        logging.getLogger(HaldexMonitor.__module__).setLevel(logging.ERROR)
+
+        # Anything still logged (monitor errors, python-can warnings) would land
+        # at the cursor, and the differential redraw never repaints unchanged
+        # sections over it - keep console log handlers quiet for the session
+        console_handlers = [
+            (handler, handler.level)
+            for handler in logging.getLogger().handlers
+            if type(handler) is logging.StreamHandler
+        ]
+        for handler, _ in console_handlers:
+            handler.setLevel(logging.CRITICAL + 1)
+
+        # Clear screen once and hide cursor, after any pending text output
+        sys.stdout.flush()
+        self.write_terminal(CLEAR_SCREEN + HIDE_CURSOR)
+
+        self._stop.clear()
+
+        # Start data collection thread
+        data_thread = threading.Thread(target=self.collect_sensor_data, daemon=True)
 
-        self.running = True
+        # Read single keystrokes without echo when attached to a terminal
+        keyboard = termios is not None and sys.stdin.isatty()
+        if keyboard:
+            saved_terminal = termios.tcgetattr(sys.stdin.fileno())
+            tty.setcbreak(sys.stdin.fileno())
 
         try:
-            # Start data collection thread
-            data_thread = threading.Thread(target=self.collect_sensor_data, daemon=True)
             data_thread.start()
 
             # Run the display
-            self.render_dashboard()
+            self.render_dashboard(keyboard)
 
         except KeyboardInterrupt:
             pass
         finally:
-            self.running = False
-            self.show_cursor()
+            # Wake both loops and let the collector finish its current cycle
+            self._stop.set()
+            if data_thread.is_alive():
+                data_thread.join(timeout=2.0)
+            self._pool.shutdown(wait=False)
+            if keyboard:
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, saved_terminal)
+            # Clear screen and show cursor, then hand stdout back to print()
+            sys.stdout.flush()
+            self.write_terminal(SHOW_CURSOR + CLEAR_SCREEN)
+            for handler, level in console_handlers:
+                handler.setLevel(level)
             self.monitor.disconnect()
-            # Clear screen and show cursor
-            self.clear_screen()
             print("Dashboard stopped.\n")
 
         return 0
@@ -314,9 +659,19 @@ def main():
 
     args = parser.parse_args()
 
+    # Resolve a wildcard device path once at startup so the monitor is
+    # handed a concrete device rather than a pattern to scan for
+    channel = args.channel
+    if '*' in channel:
+        import glob
+        devices = glob.glob(channel)
+        if devices:
+            channel = devices[0]
+            print(f"Using USB device: {channel}")
+
     dashboard = FixedDashboard(
         interface=args.interface,
-        channel=args.channel,
+        channel=channel,
         bitrate=args.bitrate
     )
 
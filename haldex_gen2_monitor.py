@@ -7,7 +7,10 @@ Requires: python-can library and UCAN device with candlelight firmware
 
 import can
 import time
+import types
 import struct
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, wait as wait_futures
 from typing import Optional, Dict, Any
 import logging
 
@@ -15,6 +18,111 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Precompiled response layouts
+CURRENTS_STRUCT = struct.Struct('>hh')        # Pump, solenoid (signed 16-bit)
+TEMPERATURE_STRUCT = struct.Struct('b')       # Signed 8-bit
+WHEEL_SPEEDS_STRUCT = struct.Struct('>HHHH')  # FR, FL, RR, RL
+
+# Request layout: [length_code, module_id, ...request_data, response_count], padded to 8 bytes
+REQUEST_STRUCT = struct.Struct('>BB4sBx')
+
+# Raw value scaling
+PRESSURE_SCALE = 0.0164     # bar per count
+WHEEL_SPEED_SCALE = 0.0156  # km/h per count
+
+# Response decoders - plain functions of the reassembled response bytes,
+# so they can be reused (e.g. on recorded traces) without a bus or monitor
+
+def decode_currents(data: bytes) -> Dict[str, Any]:
+    """Decode pump and solenoid currents (needs 9 bytes)"""
+    pump_current, solenoid_current = CURRENTS_STRUCT.unpack_from(data, 5)
+    logger.info(f"Haldex currents - Pump: {pump_current} ADC, Solenoid: {solenoid_current} ADC")
+    return {
+        'pump_current_raw': pump_current,
+        'solenoid_current_raw': solenoid_current
+    }
+
+def decode_oil_pressure(data: bytes) -> Dict[str, Any]:
+    """Decode oil pressure (needs 6 bytes)"""
+    pressure_raw = data[5]
+    pressure_bar = pressure_raw * PRESSURE_SCALE
+    logger.info(f"Haldex oil pressure: {pressure_bar:.2f} bar ({pressure_raw} raw)")
+    return {
+        'oil_pressure_raw': pressure_raw,
+        'oil_pressure_bar': pressure_bar
+    }
+
+def decode_oil_temperature(data: bytes) -> Dict[str, Any]:
+    """Decode oil temperature (needs 6 bytes)"""
+    temp_raw = TEMPERATURE_STRUCT.unpack_from(data, 5)[0]
+    logger.info(f"Haldex oil temperature: {temp_raw}°C")
+    return {
+        'oil_temperature_raw': temp_raw,
+        'oil_temperature_celsius': temp_raw
+    }
+
+def decode_wheel_speeds(data: bytes) -> Dict[str, Any]:
+    """Decode all four wheel speeds (needs 14 bytes)"""
+    fr_speed_raw, fl_speed_raw, rr_speed_raw, rl_speed_raw = WHEEL_SPEEDS_STRUCT.unpack_from(data, 6)
+
+    fr_speed = fr_speed_raw * WHEEL_SPEED_SCALE
+    fl_speed = fl_speed_raw * WHEEL_SPEED_SCALE
+    rr_speed = rr_speed_raw * WHEEL_SPEED_SCALE
+    rl_speed = rl_speed_raw * WHEEL_SPEED_SCALE
+
+    logger.info(f"Wheel speeds - FR: {fr_speed:.1f}, FL: {fl_speed:.1f}, RR: {rr_speed:.1f}, RL: {rl_speed:.1f} km/h")
+    return {
+        'front_right_speed_kmh': fr_speed,
+        'front_left_speed_kmh': fl_speed,
+        'rear_right_speed_kmh': rr_speed,
+        'rear_left_speed_kmh': rl_speed,
+        'front_right_speed_raw': fr_speed_raw,
+        'front_left_speed_raw': fl_speed_raw,
+        'rear_right_speed_raw': rr_speed_raw,
+        'rear_left_speed_raw': rl_speed_raw
+    }
+
+def _slcan_buffered_read(self, timeout: Optional[float]) -> Optional[str]:
+    """
+    Replacement for slcanBus._read that drains the serial port in one read
+
+    Stock python-can reads slcan one byte per syscall; this reads everything
+    waiting and returns one frame per call, keeping the rest buffered. An
+    idle port is waited on in a single blocking read rather than polled.
+
+    Args:
+        timeout: Maximum time to wait for a complete frame, None to block
+
+    Returns:
+        Next frame string including its terminator, or None if timeout
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    port = self.serialPortOrig
+
+    while True:
+        # Hand out frames already buffered before touching the port
+        ends = [i for i in (self._buffer.find(self._OK), self._buffer.find(self._ERROR)) if i >= 0]
+        if ends:
+            end = min(ends) + 1
+            string = self._buffer[:end].decode()
+            del self._buffer[:end]
+            return string
+
+        waiting = port.in_waiting
+        if waiting:
+            self._buffer.extend(port.read(waiting))
+            continue
+
+        # Nothing pending - block until the next byte or the deadline
+        if deadline is None:
+            port.timeout = None
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            port.timeout = remaining
+        self._buffer.extend(port.read(1))
+
 class HaldexMonitor:
     def __init__(self, interface='gs_usb', channel='/dev/tty.usbmodem*', bitrate=500000):
         """
@@ -28,13 +136,29 @@ class HaldexMonitor:
         self.interface = interface
         self.channel = channel
         self.bitrate = bitrate
+        self._resolved_channel = None  # Device matched by a wildcard channel, reused on reconnect
         self.bus = None
+        self._reader = None
+        self._reader_stop = None
+        self._keepalive_task = None
         self.multi_frame_buffer = {}
+        self.multi_frame_started = {}
+
+        # Requests in flight - futures waiting for each sensor's next response,
+        # completed from the reader thread as responses arrive
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+        # Measured request/response round trip, used to pace batched requests
+        self._sent_times = {}
+        self._last_rtt = 0.0
 
         # Haldex DEM module configuration
         self.DEM_REQUEST_ID = 0x000FFFFE
         self.DEM_RESPONSE_ID = 0x01204001
         self.DEM_MODULE_ID = 0x1a
+        self.MULTI_FRAME_TIMEOUT = 3.0  # Seconds before a partial response is dropped
 
         # Sensor request codes
         self.SENSORS = {
@@ -43,19 +167,50 @@ class HaldexMonitor:
             'oil_temperature': [0xa6, 0x00, 0x02, 0x01],
             'wheel_speeds': [0xa6, 0x00, 0x06, 0x01]
         }
+        self.SENSOR_NAMES = tuple(self.SENSORS)
+
+        # Response decoders with the minimum response length each one reads
+        self.RESPONSE_DECODERS = {
+            'pump_current': (9, decode_currents),
+            'oil_pressure': (6, decode_oil_pressure),
+            'oil_temperature': (6, decode_oil_temperature),
+            'wheel_speeds': (14, decode_wheel_speeds)
+        }
+
+        # Request frames never change, so build each sensor's message once.
+        # Responses echo the operation ID from bytes 1-2 of the request.
+        self.REQUEST_MESSAGES = {}
+        self.SENSOR_BY_OP_ID = {}
+        for sensor_name, request_data in self.SENSORS.items():
+            self.SENSOR_BY_OP_ID[(request_data[1] << 8) | request_data[2]] = sensor_name
+            data_length = len(request_data) + 1  # +1 for response count
+
+            message_data = REQUEST_STRUCT.pack(
+                0xc8 + data_length,   # Message length (0xc8 + data bytes)
+                self.DEM_MODULE_ID,   # DEM module ID (0x1a)
+                bytes(request_data),
+                0x01                  # 1 response expected
+            )
+
+            self.REQUEST_MESSAGES[sensor_name] = can.Message(
+                arbitration_id=self.DEM_REQUEST_ID,
+                data=message_data,
+                is_extended_id=True
+            )
 
     def connect(self):
         """Initialize CAN bus connection"""
         try:
             # Auto-detect USB device if wildcard used
-            if '*' in self.channel:
+            channel = self._resolved_channel or self.channel
+            if '*' in channel:
                 import glob
-                devices = glob.glob(self.channel)
+                devices = glob.glob(channel)
                 if not devices:
-                    logger.error(f"No USB devices found matching {self.channel}")
+                    logger.error(f"No USB devices found matching {channel}")
                     return False
-                self.channel = devices[0]
-                logger.info(f"Found USB device: {self.channel}")
+                channel = self._resolved_channel = devices[0]
+                logger.info(f"Found USB device: {channel}")
 
             # Try multiple interfaces for candlelight firmware compatibility
             interfaces_to_try = []
@@ -72,25 +227,41 @@ class HaldexMonitor:
                     if interface == 'serial':
                         # For serial interface, we need to configure SLCAN mode
                         self.bus = can.interface.Bus(
-                            channel=self.channel,
+                            channel=channel,
                             interface='slcan',
                             bitrate=self.bitrate
                         )
                     else:
                         self.bus = can.interface.Bus(
-                            channel=self.channel,
+                            channel=channel,
                             interface=interface,
                             bitrate=self.bitrate
                         )
 
-                    logger.info(f"Connected to CAN bus: {interface} on {self.channel} at {self.bitrate}bps")
+                    logger.info(f"Connected to CAN bus: {interface} on {channel} at {self.bitrate}bps")
+
+                    # slcan reads one byte per syscall; swap in a buffered read
+                    if hasattr(self.bus, 'serialPortOrig') and hasattr(self.bus, '_buffer'):
+                        self.bus._read = types.MethodType(_slcan_buffered_read, self.bus)
+
+                    # Receive on a dedicated thread; responses are routed to
+                    # waiting requests by operation ID
+                    self._reader_stop = threading.Event()
+                    self._reader = threading.Thread(
+                        target=self._reader_loop,
+                        args=(self.bus, self._reader_stop),
+                        name='can-reader',
+                        daemon=True
+                    )
+                    self._reader.start()
                     return True
 
                 except Exception as interface_error:
                     logger.debug(f"Interface {interface} failed: {interface_error}")
                     continue
 
-            # If all interfaces failed
+            # If all interfaces failed, look for the device again next time
+            self._resolved_channel = None
             logger.error("Failed to connect with any interface")
             logger.error("Make sure your CANtact/UCAN device is connected and has candlelight firmware")
             logger.error("You may need to install: pip install pyusb")
@@ -102,10 +273,37 @@ class HaldexMonitor:
 
     def disconnect(self):
         """Close CAN bus connection"""
+        self.stop_keepalive()
+        if self._reader:
+            self._reader_stop.set()
+            self._reader.join()
+            self._reader = None
         if self.bus:
             self.bus.shutdown()
+            self.bus = None
             logger.info("Disconnected from CAN bus")
 
+    def auto_reconnect(self, max_retries: int = 3) -> bool:
+        """
+        Reopen the CAN bus after an error, reusing the resolved device
+
+        Args:
+            max_retries: Connection attempts before giving up
+
+        Returns:
+            True if reconnected
+        """
+        self.disconnect()
+        for attempt in range(1, max_retries + 1):
+            logger.warning(f"Reconnecting to CAN bus (attempt {attempt}/{max_retries})")
+            if self.connect():
+                return True
+            if attempt < max_retries:
+                time.sleep(1.0)
+
+        logger.error("Could not reconnect to CAN bus")
+        return False
+
     def send_request(self, sensor_name: str) -> bool:
         """
         Send request message to Haldex DEM module
@@ -116,7 +314,8 @@ class HaldexMonitor:
         Returns:
             True if message sent successfully
         """
-        if sensor_name not in self.SENSORS:
+        msg = self.REQUEST_MESSAGES.get(sensor_name)
+        if msg is None:
             logger.error(f"Unknown sensor: {sensor_name}")
             return False
 
@@ -124,32 +323,15 @@ class HaldexMonitor:
             logger.error("CAN bus not connected")
             return False
 
-        # Build request message
-        request_data = self.SENSORS[sensor_name]
-        data_length = len(request_data) + 1  # +1 for response count
-
-        # Message format: [length_code, module_id, ...request_data, response_count]
-        message_data = [
-            0xc8 + data_length,  # Message length (0xc8 + data bytes)
-            self.DEM_MODULE_ID,  # DEM module ID (0x1a)
-        ] + request_data + [0x01]  # Request data + 1 response expected
-
-        # Pad to 8 bytes
-        while len(message_data) < 8:
-            message_data.append(0x00)
-
-        # Create CAN message
-        msg = can.Message(
-            arbitration_id=self.DEM_REQUEST_ID,
-            data=message_data,
-            is_extended_id=True
-        )
-
         try:
-            self.bus.send(msg)
-            logger.info(f"Sent request for {sensor_name}: {' '.join(f'{b:02X}' for b in message_data)}")
+            with self._send_lock:
+                self._sent_times[sensor_name] = time.monotonic()
+                self.bus.send(msg)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Sent request for {sensor_name}: {' '.join(f'{b:02X}' for b in msg.data)}")
             return True
         except Exception as e:
+            self._sent_times.pop(sensor_name, None)
             logger.error(f"Failed to send request: {e}")
             return False
 
@@ -168,32 +350,41 @@ class HaldexMonitor:
 
         # Check if this is start of multi-frame sequence
         if data[0] & 0x80:  # Frame start bit
-            self.multi_frame_buffer[msg_id] = bytearray()
-            frame_length = data[0] & 0x0f
             # Copy all data for first frame
-            self.multi_frame_buffer[msg_id].extend(data)
-            logger.debug(f"Multi-frame start: {' '.join(f'{b:02X}' for b in data)}")
+            self.multi_frame_buffer[msg_id] = bytearray(data)
+            self.multi_frame_started[msg_id] = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Multi-frame start: {' '.join(f'{b:02X}' for b in data)}")
         else:
             # Continuation frame
             if msg_id not in self.multi_frame_buffer:
                 logger.warning("Received continuation frame without start frame")
                 return None
 
+            # Drop a sequence whose remaining frames never arrived
+            if time.monotonic() - self.multi_frame_started[msg_id] > self.MULTI_FRAME_TIMEOUT:
+                del self.multi_frame_buffer[msg_id]
+                del self.multi_frame_started[msg_id]
+                logger.warning("Discarding stale multi-frame sequence")
+                return None
+
             # Skip frame header byte and copy data
             frame_data_len = data[0] & 0x0f
             if frame_data_len > 0:
-                self.multi_frame_buffer[msg_id].extend(data[1:frame_data_len+1])
+                self.multi_frame_buffer[msg_id] += memoryview(data)[1:frame_data_len+1]
 
-            logger.debug(f"Multi-frame continuation: {' '.join(f'{b:02X}' for b in data)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Multi-frame continuation: {' '.join(f'{b:02X}' for b in data)}")
 
         # Check if this is the end frame
         if data[0] & 0x40 == 0:  # Not end frame
             return None
 
         # Frame sequence complete
-        complete_data = bytes(self.multi_frame_buffer[msg_id])
-        del self.multi_frame_buffer[msg_id]
-        logger.debug(f"Multi-frame complete: {' '.join(f'{b:02X}' for b in complete_data)}")
+        complete_data = bytes(self.multi_frame_buffer.pop(msg_id))
+        del self.multi_frame_started[msg_id]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Multi-frame complete: {' '.join(f'{b:02X}' for b in complete_data)}")
         return complete_data
 
     def parse_sensor_response(self, data: bytes, sensor_name: str) -> Dict[str, Any]:
@@ -207,113 +398,136 @@ class HaldexMonitor:
         Returns:
             Dictionary with parsed sensor values
         """
-        result = {}
+        decoder = self.RESPONSE_DECODERS.get(sensor_name)
+        if decoder is None:
+            return {}
 
-        if len(data) < 6:
+        min_length, decode = decoder
+        if len(data) < min_length:
             logger.warning("Response data too short")
-            return result
-
-        if sensor_name == 'pump_current':
-            # Extract pump and solenoid currents
-            if len(data) >= 9:
-                pump_current = struct.unpack('>h', data[5:7])[0]  # Signed 16-bit
-                solenoid_current = struct.unpack('>h', data[7:9])[0]  # Signed 16-bit
-                result = {
-                    'pump_current_raw': pump_current,
-                    'solenoid_current_raw': solenoid_current
-                }
-                logger.info(f"Haldex currents - Pump: {pump_current} ADC, Solenoid: {solenoid_current} ADC")
-
-        elif sensor_name == 'oil_pressure':
-            pressure_raw = data[5]
-            pressure_bar = pressure_raw * 0.0164
-            result = {
-                'oil_pressure_raw': pressure_raw,
-                'oil_pressure_bar': pressure_bar
-            }
-            logger.info(f"Haldex oil pressure: {pressure_bar:.2f} bar ({pressure_raw} raw)")
-
-        elif sensor_name == 'oil_temperature':
-            temp_raw = struct.unpack('b', data[5:6])[0]  # Signed 8-bit
-            result = {
-                'oil_temperature_raw': temp_raw,
-                'oil_temperature_celsius': temp_raw
-            }
-            logger.info(f"Haldex oil temperature: {temp_raw}°C")
-
-        elif sensor_name == 'wheel_speeds':
-            # Extract all four wheel speeds
-            if len(data) >= 14:
-                fr_speed_raw = struct.unpack('>H', data[6:8])[0]   # Front right
-                fl_speed_raw = struct.unpack('>H', data[8:10])[0]  # Front left
-                rr_speed_raw = struct.unpack('>H', data[10:12])[0] # Rear right
-                rl_speed_raw = struct.unpack('>H', data[12:14])[0] # Rear left
-
-                fr_speed = fr_speed_raw * 0.0156
-                fl_speed = fl_speed_raw * 0.0156
-                rr_speed = rr_speed_raw * 0.0156
-                rl_speed = rl_speed_raw * 0.0156
-
-                result = {
-                    'front_right_speed_kmh': fr_speed,
-                    'front_left_speed_kmh': fl_speed,
-                    'rear_right_speed_kmh': rr_speed,
-                    'rear_left_speed_kmh': rl_speed,
-                    'front_right_speed_raw': fr_speed_raw,
-                    'front_left_speed_raw': fl_speed_raw,
-                    'rear_right_speed_raw': rr_speed_raw,
-                    'rear_left_speed_raw': rl_speed_raw
-                }
-                logger.info(f"Wheel speeds - FR: {fr_speed:.1f}, FL: {fl_speed:.1f}, RR: {rr_speed:.1f}, RL: {rl_speed:.1f} km/h")
-
-        return result
-
-    def listen_for_response(self, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
-        """
-        Listen for DEM module response
+            return {}
 
-        Args:
-            timeout: Maximum time to wait for response
+        return decode(data)
 
-        Returns:
-            Parsed sensor data or None if timeout
+    def _reader_loop(self, bus: can.BusABC, stop: threading.Event):
         """
-        if not self.bus:
-            logger.error("CAN bus not connected")
-            return None
-
-        start_time = time.time()
+        Receive thread - block for the next frame, then drain any already buffered
 
-        while time.time() - start_time < timeout:
+        Args:
+            bus: CAN bus to read from
+            stop: Event that ends the loop
+        """
+        while not stop.is_set():
             try:
-                msg = self.bus.recv(timeout=0.1)
-                if msg and msg.arbitration_id == self.DEM_RESPONSE_ID:
-                    logger.debug(f"Received response: {' '.join(f'{b:02X}' for b in msg.data)}")
-
-                    # Handle multi-frame response
-                    complete_data = self.parse_multi_frame_response(msg)
-                    if complete_data:
-                        # Determine sensor type from response
-                        if len(complete_data) >= 5:
-                            op_id = (complete_data[3] << 8) | complete_data[4]
-
-                            if op_id == 0x0005:
-                                return self.parse_sensor_response(complete_data, 'pump_current')
-                            elif op_id == 0x0003:
-                                return self.parse_sensor_response(complete_data, 'oil_pressure')
-                            elif op_id == 0x0002:
-                                return self.parse_sensor_response(complete_data, 'oil_temperature')
-                            elif op_id == 0x0006:
-                                return self.parse_sensor_response(complete_data, 'wheel_speeds')
+                msg = bus.recv(1.0)
+
+                # Handle frames that arrived together (e.g. the rest of a
+                # multi-frame response) before blocking again
+                while msg is not None and not stop.is_set():
+                    self._on_message(msg)
+                    msg = bus.recv(0)
 
             except can.CanTimeoutError:
                 continue
             except Exception as e:
-                logger.error(f"Error receiving message: {e}")
-                break
+                # Keep the only receive thread alive; back off and retry
+                if stop.is_set():
+                    break
+                logger.error(f"CAN receive failed: {e}")
+                stop.wait(0.5)
+
+    def _on_message(self, msg: can.Message):
+        """
+        Reader callback - reassemble DEM responses and complete waiting requests
 
-        logger.warning("Timeout waiting for response")
-        return None
+        Args:
+            msg: CAN message received
+        """
+        if msg.arbitration_id != self.DEM_RESPONSE_ID:
+            return
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received response: {' '.join(f'{b:02X}' for b in msg.data)}")
+
+            # Handle multi-frame response
+            complete_data = self.parse_multi_frame_response(msg)
+            if not complete_data or len(complete_data) < 5:
+                return
+
+            # Determine sensor type from response
+            op_id = (complete_data[3] << 8) | complete_data[4]
+            sensor_name = self.SENSOR_BY_OP_ID.get(op_id)
+            if sensor_name is None:
+                return
+
+            sent_time = self._sent_times.pop(sensor_name, None)
+            if sent_time is not None:
+                self._last_rtt = time.monotonic() - sent_time
+
+            result = self.parse_sensor_response(complete_data, sensor_name)
+            with self._pending_lock:
+                futures = self._pending.pop(sensor_name, ())
+            for future in futures:
+                future.set_result(result)
+
+        except Exception as e:
+            # Never let a bad frame kill the reader thread
+            logger.error(f"Error handling response: {e}")
+
+    def _discard_request(self, sensor_name: str, future: Future):
+        """Stop waiting for a response that did not arrive"""
+        with self._pending_lock:
+            futures = self._pending.get(sensor_name)
+            if futures and future in futures:
+                futures.remove(future)
+
+        # A late reply must not be timed against this request
+        self._sent_times.pop(sensor_name, None)
+
+    def _expect_response(self, sensor_name: str) -> Future:
+        """Register a future for the sensor's next response without sending a request"""
+        future = Future()
+        with self._pending_lock:
+            self._pending.setdefault(sensor_name, []).append(future)
+        return future
+
+    def submit_request(self, sensor_name: str) -> Optional[Future]:
+        """
+        Send a sensor request without waiting for the response
+
+        Args:
+            sensor_name: Name of sensor to request
+
+        Returns:
+            Future resolving to the parsed sensor data, or None if the request could not be sent
+        """
+        # Register before sending so a fast response cannot be missed
+        future = self._expect_response(sensor_name)
+
+        if not self.send_request(sensor_name):
+            self._discard_request(sensor_name, future)
+            return None
+        return future
+
+    def wait_for_response(self, sensor_name: str, future: Future, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the response to a submitted request
+
+        Args:
+            sensor_name: Name of sensor requested
+            future: Future returned by submit_request
+            timeout: Maximum time to wait for response
+
+        Returns:
+            Parsed sensor data or None if timeout
+        """
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            self._discard_request(sensor_name, future)
+            logger.warning(f"Timeout waiting for {sensor_name} response")
+            return None
 
     def request_sensor(self, sensor_name: str, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
         """
@@ -326,9 +540,90 @@ class HaldexMonitor:
         Returns:
             Parsed sensor data or None if failed
         """
-        if self.send_request(sensor_name):
-            return self.listen_for_response(timeout)
-        return None
+        future = self.submit_request(sensor_name)
+        if future is None:
+            return None
+        return self.wait_for_response(sensor_name, future, timeout)
+
+    def request_all(self, timeout: float = 2.0) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Request every sensor at once and wait for all responses together
+
+        Args:
+            timeout: Maximum time to wait for all responses
+
+        Returns:
+            Parsed sensor data (or None if failed) keyed by sensor name
+        """
+        # Submit everything before waiting on anything, spacing requests by
+        # twice the module's last measured response time (none until known),
+        # capped so the spacing can never eat the whole timeout
+        spacing = min(2 * self._last_rtt, timeout / len(self.SENSOR_NAMES))
+        futures = {}
+        for sensor_name in self.SENSOR_NAMES:
+            if futures and spacing:
+                time.sleep(spacing)
+            futures[sensor_name] = self.submit_request(sensor_name)
+        wait_futures([f for f in futures.values() if f is not None], timeout=timeout)
+
+        results = {}
+        for sensor_name, future in futures.items():
+            if future is not None and future.done():
+                results[sensor_name] = future.result()
+            else:
+                if future is not None:
+                    self._discard_request(sensor_name, future)
+                    logger.warning(f"Timeout waiting for {sensor_name} response")
+                results[sensor_name] = None
+        return results
+
+    def print_readings(self, results: Dict[str, Optional[Dict[str, Any]]]):
+        """
+        Print one reading per sensor
+
+        Args:
+            results: Parsed sensor data keyed by sensor name, as from request_all
+        """
+        for sensor_name, result in results.items():
+            print(f"\nRequesting {sensor_name}...")
+            if result:
+                for key, value in result.items():
+                    print(f"  {key}: {value}")
+            else:
+                print(f"  Failed to get {sensor_name}")
+
+    def start_keepalive(self, interval: float = 0.5) -> bool:
+        """
+        Have python-can send the oil temperature request periodically
+
+        Args:
+            interval: Time between keep-alive requests (seconds)
+
+        Returns:
+            True if the periodic keep-alive was started
+        """
+        if not self.bus:
+            logger.error("CAN bus not connected")
+            return False
+
+        self.stop_keepalive()
+
+        # python-can's threaded periodic sender holds the bus's _lock_send_periodic
+        # around each send; share ours so keep-alives and requests never write
+        # to the bus at the same time
+        self.bus._lock_send_periodic = self._send_lock
+        try:
+            self._keepalive_task = self.bus.send_periodic(self.REQUEST_MESSAGES['oil_temperature'], interval)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start keep-alive: {e}")
+            return False
+
+    def stop_keepalive(self):
+        """Stop the periodic keep-alive request"""
+        if self._keepalive_task:
+            self._keepalive_task.stop()
+            self._keepalive_task = None
 
     def keep_alive_mode(self, interval: float = 0.5):
         """
@@ -342,24 +637,30 @@ class HaldexMonitor:
         logger.info("This will continuously request oil temperature to keep module awake")
         logger.info("Switch on your bench module now!")
 
+        if not self.start_keepalive(interval):
+            return
+
         try:
             while True:
-                # Send simple oil temperature request as keep-alive
-                if self.send_request('oil_temperature'):
-                    # Listen for any response (don't care about parsing)
-                    response = self.listen_for_response(timeout=0.3)
-                    if response:
-                        temp = response.get('oil_temperature_celsius', 'unknown')
-                        logger.info(f"Module responding - Temperature: {temp}°C - keeping alive")
-                    else:
-                        logger.debug("No response (module may be sleeping)")
+                # python-can sends the oil temperature requests; just report the responses
+                future = self._expect_response('oil_temperature')
+                response = self.wait_for_response('oil_temperature', future, timeout=interval + 0.3)
+                if response:
+                    temp = response.get('oil_temperature_celsius', 'unknown')
+                    logger.info(f"Module responding - Temperature: {temp}°C - keeping alive")
                 else:
-                    logger.warning("Failed to send keep-alive request")
+                    logger.debug("No response (module may be sleeping)")
 
-                time.sleep(interval)
+                    # A periodic task stops quietly if the bus fails, so check by hand
+                    if not self.send_request('oil_temperature'):
+                        logger.warning("Failed to send keep-alive request")
+                        if not (self.auto_reconnect() and self.start_keepalive(interval)):
+                            break
 
         except KeyboardInterrupt:
             logger.info("Keep-alive mode stopped by user")
+        finally:
+            self.stop_keepalive()
 
     def monitor_with_keepalive(self, monitor_interval: float = 2.0, keepalive_interval: float = 0.5, count: int = 0):
         """
@@ -373,43 +674,30 @@ class HaldexMonitor:
         logger.info(f"Starting monitoring with keep-alive")
         logger.info(f"Monitor interval: {monitor_interval}s, Keep-alive interval: {keepalive_interval}s")
 
-        last_monitor_time = 0
-        last_keepalive_time = 0
+        # Keep-alives go out from python-can's own thread, so waiting on a
+        # slow sensor response never delays them
+        if not self.start_keepalive(keepalive_interval):
+            return
+
+        next_monitor_time = time.monotonic()
         readings = 0
 
         try:
             while count == 0 or readings < count:
-                current_time = time.time()
-
-                # Send keep-alive if needed
-                if current_time - last_keepalive_time >= keepalive_interval:
-                    self.send_request('oil_temperature')  # Quick keep-alive
-                    self.listen_for_response(timeout=0.2)  # Quick check
-                    last_keepalive_time = current_time
+                time.sleep(max(0.0, next_monitor_time - time.monotonic()))
+                next_monitor_time = time.monotonic() + monitor_interval
 
-                # Do full monitoring if needed
-                if current_time - last_monitor_time >= monitor_interval:
-                    print(f"\n--- Reading {readings + 1} ---")
-
-                    # Request each sensor
-                    for sensor_name in self.SENSORS.keys():
-                        print(f"\nRequesting {sensor_name}...")
-                        result = self.request_sensor(sensor_name)
-                        if result:
-                            for key, value in result.items():
-                                print(f"  {key}: {value}")
-                        else:
-                            print(f"  Failed to get {sensor_name}")
-
-                        time.sleep(0.3)  # Small delay between requests
+                print(f"\n--- Reading {readings + 1} ---")
 
-                    readings += 1
-                    last_monitor_time = current_time
+                # Request all sensors at once
+                self.print_readings(self.request_all())
 
-                time.sleep(0.1)  # Small sleep to prevent busy loop
+                readings += 1
 
         except KeyboardInterrupt:
             logger.info("Monitoring with keep-alive stopped by user")
+        finally:
+            self.stop_keepalive()
 
     def monitor_all_sensors(self, interval: float = 1.0, count: int = 10):
         """
@@ -426,17 +714,8 @@ class HaldexMonitor:
             try:
                 print(f"\n--- Reading {readings + 1} ---")
 
-                # Request each sensor
-                for sensor_name in self.SENSORS.keys():
-                    print(f"\nRequesting {sensor_name}...")
-                    result = self.request_sensor(sensor_name)
-                    if result:
-                        for key, value in result.items():
-                            print(f"  {key}: {value}")
-                    else:
-                        print(f"  Failed to get {sensor_name}")
-
-                    time.sleep(0.5)  # Small delay between requests
+                # Request all sensors at once
+                self.print_readings(self.request_all())
 
                 readings += 1
                 if count == 0 or readings < count: